@@ -1,13 +1,14 @@
+import functools
 import importlib
-import inspect
 import logging
 import os
+import re
 import sys
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, List, Optional, Type
 
-import pkg_resources
+from packaging.requirements import Requirement
 from ruamel.yaml import YAML
 
 from great_expectations.core.expectation_diagnostics.expectation_diagnostics import (
@@ -19,7 +20,18 @@ from great_expectations.types import SerializableDictDot
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-yaml = YAML()
+# package_info.yml is a plain mapping, so the safe loader (backed by libyaml's C parser
+# when available) is sufficient and avoids the round-trip machinery
+yaml = YAML(typ="safe")
+
+
+def _read_optional_file(path: str) -> Optional[str]:
+    # Opening directly (rather than checking os.path.exists first) saves a stat call
+    try:
+        with open(path) as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
 
 
 @dataclass
@@ -38,6 +50,43 @@ class Dependency(SerializableDictDot):
     version: Optional[str] = None
 
 
+def _parse_requirements(contents: str) -> List[Requirement]:
+    requirements = []
+    continuation = ""
+    for line in contents.splitlines():
+        # Drop full-line and inline comments (the latter must be preceded by whitespace)
+        if line.lstrip().startswith("#"):
+            continue
+        line = line.split(" #", 1)[0].strip()
+        if not line:
+            continue
+
+        # Lines ending with a backslash are joined with the next non-empty line
+        if line.endswith("\\"):
+            continuation += f"{line[:-1].rstrip()} "
+            continue
+
+        requirements.append(Requirement(continuation + line))
+        continuation = ""
+    return requirements
+
+
+def _convert_to_dependency(requirement: Requirement) -> Dependency:
+    # Match pkg_resources.safe_name() (e.g. "scikit_learn" -> "scikit-learn")
+    name = re.sub(r"[^A-Za-z0-9.]+", "-", requirement.name)
+    pypi_url = f"https://pypi.org/project/{name}"
+
+    # Stringify tuple of pins; most requirements have at most one so skip sorting those
+    specs = [(spec.operator, spec.version) for spec in requirement.specifier]
+    if not specs:
+        version = None
+    elif len(specs) == 1:
+        version = "".join(specs[0])
+    else:
+        version = ", ".join("".join(pin) for pin in sorted(specs))
+    return Dependency(text=name, link=pypi_url, version=version)
+
+
 @dataclass
 class GitHubUser(SerializableDictDot):
     username: str
@@ -71,6 +120,16 @@ class Maturity(str, Enum):
     PRODUCTION = "PRODUCTION"
 
 
+# Maturity levels from least to most mature, and the position of each (by name) within that order
+_MATURITY_ORDER = (
+    Maturity.CONCEPT_ONLY,
+    Maturity.EXPERIMENTAL,
+    Maturity.BETA,
+    Maturity.PRODUCTION,
+)
+_MATURITY_INDEX = {maturity.name: i for i, maturity in enumerate(_MATURITY_ORDER)}
+
+
 @dataclass
 class GreatExpectationsContribPackageManifest(SerializableDictDot):
     # Core
@@ -109,12 +168,12 @@ class GreatExpectationsContribPackageManifest(SerializableDictDot):
         self._update_contributors(diagnostics)
 
     def _update_from_package_info(self, path: str) -> None:
-        if not os.path.exists(path):
+        contents = _read_optional_file(path)
+        if contents is None:
             logger.warning(f"Could not find package info file {path}")
             return
 
-        with open(path) as f:
-            data: dict = yaml.load(f.read())
+        data: dict = yaml.load(contents)
 
         if not data:
             logger.warning(f"{path} is empty so exiting early")
@@ -143,58 +202,45 @@ class GreatExpectationsContribPackageManifest(SerializableDictDot):
                 self.domain_experts.append(domain_expert)
 
     def _update_expectations(self, diagnostics: List[ExpectationDiagnostics]) -> None:
-        expectations = []
-        status = {maturity.name: 0 for maturity in Maturity}
+        expectations = list(diagnostics)
 
-        for diagnostic in diagnostics:
-            expectations.append(diagnostic)
-            expectation_maturity = diagnostic.library_metadata.maturity
-            status[expectation_maturity] += 1
+        counts = [0] * len(_MATURITY_ORDER)
+        for diagnostic in expectations:
+            counts[_MATURITY_INDEX[diagnostic.library_metadata.maturity]] += 1
 
         self.expectations = expectations
         self.expectation_count = len(expectations)
+        self.status = PackageCompletenessStatus(
+            concept_only=counts[0],
+            experimental=counts[1],
+            beta=counts[2],
+            production=counts[3],
+            total=len(expectations),
+        )
 
-        # Enum is all caps but status attributes are lowercase
-        lowercase_status = {k.lower(): v for k, v in status.items()}
-        lowercase_status["total"] = sum(status.values())
-        self.status = PackageCompletenessStatus(**lowercase_status)
-
-        maturity = max(status, key=status.get)  # Get the key with the max value
-        self.maturity = Maturity[maturity]
+        # Get the most common maturity; ties go to the least mature level
+        self.maturity = _MATURITY_ORDER[counts.index(max(counts))]
 
     def _update_dependencies(self, path: str) -> None:
-        if not os.path.exists(path):
+        contents = _read_optional_file(path)
+        if contents is None:
             logger.warning(f"Could not find requirements file {path}")
             return
 
-        with open(path) as f:
-            requirements = [req for req in pkg_resources.parse_requirements(f)]
-
-        def _convert_to_dependency(
-            requirement: pkg_resources.Requirement,
-        ) -> Dependency:
-            name = requirement.project_name
-            pypi_url = f"https://pypi.org/project/{name}"
-            if requirement.specs:
-                # Stringify tuple of pins
-                version = ", ".join(
-                    "".join(symbol for symbol in pin)
-                    for pin in sorted(requirement.specs)
-                )
-            else:
-                version = None
-            return Dependency(text=name, link=pypi_url, version=version)
-
-        dependencies = list(map(_convert_to_dependency, requirements))
+        requirements = _parse_requirements(contents)
+        dependencies = [
+            _convert_to_dependency(requirement) for requirement in requirements
+        ]
         self.dependencies = dependencies
 
     def _update_contributors(self, diagnostics: List[ExpectationDiagnostics]) -> None:
         contributors = []
+        seen = set()
         for diagnostic in diagnostics:
             for contributor in diagnostic.library_metadata.contributors:
-                github_user = GitHubUser(contributor)
-                if github_user not in contributors:
-                    contributors.append(github_user)
+                if contributor not in seen:
+                    seen.add(contributor)
+                    contributors.append(GitHubUser(contributor))
 
         self.contributors = contributors
 
@@ -224,10 +270,22 @@ class GreatExpectationsContribPackageManifest(SerializableDictDot):
 
     @staticmethod
     def _identify_user_package() -> str:
+        # Results are cached per working directory so repeated calls skip the directory scan
+        return GreatExpectationsContribPackageManifest._identify_user_package_in_dir(
+            os.getcwd()
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _identify_user_package_in_dir(directory: str) -> str:
         # Guaranteed to have a dir named '<MY_PACKAGE>_expectations' through Cookiecutter validation
-        packages = [
-            d for d in os.listdir() if os.path.isdir(d) and d.endswith("_expectations")
-        ]
+        # DirEntry caches the file type from the directory listing, avoiding a stat per entry
+        with os.scandir(directory) as entries:
+            packages = [
+                entry.name
+                for entry in entries
+                if entry.name.endswith("_expectations") and entry.is_dir()
+            ]
 
         # A sanity check in case the user modifies the Cookiecutter template in unexpected ways
         if len(packages) == 0:
@@ -238,10 +296,12 @@ class GreatExpectationsContribPackageManifest(SerializableDictDot):
         return packages[0]
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def _import_expectations_module(package: str) -> Any:
         # Need to add user's project to the PYTHONPATH
         cwd = os.getcwd()
-        sys.path.append(cwd)
+        if cwd not in sys.path:
+            sys.path.append(cwd)
         try:
             expectations_module = importlib.import_module(f"{package}.expectations")
             return expectations_module
@@ -252,10 +312,21 @@ class GreatExpectationsContribPackageManifest(SerializableDictDot):
     def _retrieve_expectations_from_module(
         expectations_module: Any,
     ) -> List[Type[Expectation]]:
+        # Only consider classes defined within the user's package; anything else (such as
+        # base classes imported from great_expectations) is skipped before subclass checks
+        module_name = expectations_module.__name__
+        module_prefix = f"{module_name}."
+
         expectations: List[Type[Expectation]] = []
         names: List[str] = []
-        for name, obj in inspect.getmembers(expectations_module):
-            if inspect.isclass(obj) and issubclass(obj, Expectation):
+        for name, obj in vars(expectations_module).items():
+            if not isinstance(obj, type):
+                continue
+            if obj.__module__ != module_name and not obj.__module__.startswith(
+                module_prefix
+            ):
+                continue
+            if issubclass(obj, Expectation):
                 expectations.append(obj)
                 names.append(name)
 
@@ -1,3 +1,4 @@
+import types
 from typing import List
 
 import py
@@ -22,6 +23,10 @@ from great_expectations.expectations.core.expect_column_most_common_value_to_be_
 from great_expectations.expectations.core.expect_column_stdev_to_be_between import (
     ExpectColumnStdevToBeBetween,
 )
+from great_expectations.expectations.registry import (
+    _registered_expectations,
+    _registered_renderers,
+)
 
 
 @pytest.fixture
@@ -95,6 +100,47 @@ ruamel.yaml>=0.16,<0.17.18  # package
     ]
 
 
+def test_update_dependencies_joins_line_continuations(
+    tmpdir: py.path.local, package: GreatExpectationsContribPackageManifest
+):
+    requirements_file = tmpdir.mkdir("tmp").join("requirements.txt")
+    contents = """
+requests \\
+  >=2  # package
+numpy>=1.14.1
+    """
+    requirements_file.write(contents)
+
+    package._update_dependencies(str(requirements_file))
+    assert package.dependencies == [
+        Dependency(
+            text="requests", link="https://pypi.org/project/requests", version=">=2"
+        ),
+        Dependency(
+            text="numpy", link="https://pypi.org/project/numpy", version=">=1.14.1"
+        ),
+    ]
+
+
+def test_update_dependencies_normalizes_project_names(
+    tmpdir: py.path.local, package: GreatExpectationsContribPackageManifest
+):
+    requirements_file = tmpdir.mkdir("tmp").join("requirements.txt")
+    contents = """
+scikit_learn>=1.0
+    """
+    requirements_file.write(contents)
+
+    package._update_dependencies(str(requirements_file))
+    assert package.dependencies == [
+        Dependency(
+            text="scikit-learn",
+            link="https://pypi.org/project/scikit-learn",
+            version=">=1.0",
+        ),
+    ]
+
+
 def test_update_dependencies_with_invalid_path_exits_early(
     package: GreatExpectationsContribPackageManifest,
 ):
@@ -151,3 +197,33 @@ def test_update_from_package_info_with_invalid_path_exits_early(
     # Unchanged attrs since file state is invalid
     assert package.code_owners == code_owners
     assert package.domain_experts == domain_experts
+
+
+@pytest.fixture
+def user_expectation():
+    # Defining an Expectation subclass registers it globally, so undo that afterwards
+    expectation = type(
+        "ExpectColumnMinToBeBetweenForContribPackage",
+        (ExpectColumnMinToBeBetween,),
+        {"__module__": "my_package_expectations.expectations.expect_column_min"},
+    )
+    yield expectation
+    _registered_expectations.pop(expectation.expectation_type, None)
+    _registered_renderers.pop(expectation.expectation_type, None)
+
+
+def test_retrieve_expectations_from_module_skips_classes_outside_of_package(
+    user_expectation: type,
+):
+    module = types.ModuleType("my_package_expectations.expectations")
+    module.ExpectColumnMinToBeBetweenForContribPackage = user_expectation
+    module.ExpectColumnStdevToBeBetween = ExpectColumnStdevToBeBetween
+    module.some_constant = 42
+
+    expectations = (
+        GreatExpectationsContribPackageManifest._retrieve_expectations_from_module(
+            module
+        )
+    )
+
+    assert expectations == [user_expectation]
@@ -1,6 +1,6 @@
-from collections import defaultdict
-from dataclasses import asdict, dataclass
-from typing import List, Tuple
+import re
+from dataclasses import asdict, dataclass, fields
+from typing import Dict, List, Optional, Tuple
 
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.core.expectation_diagnostics.expectation_test_data_cases import (
@@ -22,6 +22,14 @@ from great_expectations.types import SerializableDictDot
 
 # from pydantic.dataclasses import dataclass
 
+# Execution engine names in the (alphabetical) order they are listed in the serialized output
+_EXECUTION_ENGINE_NAMES = tuple(
+    sorted(field.name for field in fields(ExpectationExecutionEngineDiagnostics))
+)
+
+# Matches private renderer methods (e.g. "_prescriptive_renderer"), capturing the renderer type
+_RENDERER_METHOD_NAME_REGEX = re.compile(r"^_([a-z]+)_.*renderer$")
+
 
 @dataclass(frozen=True)
 class ExpectationDiagnostics(SerializableDictDot):
@@ -58,13 +66,12 @@ class ExpectationDiagnostics(SerializableDictDot):
 
     def to_json_dict(self) -> dict:
         result = convert_to_json_serializable(data=asdict(self))
-        result["execution_engines_list"] = sorted(
-            [
-                engine
-                for engine, _bool in result["execution_engines"].items()
-                if _bool is True
-            ]
-        )
+        execution_engines = result["execution_engines"]
+        result["execution_engines_list"] = [
+            engine
+            for engine in _EXECUTION_ENGINE_NAMES
+            if execution_engines.get(engine) is True
+        ]
         return result
 
     def generate_checklist(self) -> str:
@@ -134,7 +141,6 @@ class ExpectationDiagnostics(SerializableDictDot):
             and (negative_case_count > 0)
             and (unexpected_case_count == 0)
         )
-        print(positive_case_count, negative_case_count, unexpected_case_count, passed)
         return ExpectationDiagnosticCheckMessage(
             message=message,
             passed=passed,
@@ -143,28 +149,30 @@ class ExpectationDiagnostics(SerializableDictDot):
     @staticmethod
     def _check_core_logic_for_at_least_one_execution_engine(
         test_results: List[ExpectationTestDiagnostics],
+        backend_results: Optional[Dict[str, List[int]]] = None,
     ) -> ExpectationDiagnosticCheckMessage:
         """Check whether core logic for this Expectation exists and passes tests on at least one Execution Engine"""
 
         sub_messages = []
         backends_passing_all_tests = []
-        backend_results = defaultdict(list)
+        if backend_results is None:
+            backend_results = ExpectationDiagnostics._tally_test_results_by_backend(
+                test_results
+            )
         passed = False
         message = "Has core logic and passes tests on at least one Execution Engine"
 
-        for test_result in test_results:
-            backend_results[test_result.backend].append(test_result.test_passed)
-
-        for backend in backend_results:
-            if all(backend_results[backend]):
+        for backend, (num_tests, num_passing) in backend_results.items():
+            if num_passing == num_tests:
                 backends_passing_all_tests.append(backend)
 
         if len(backends_passing_all_tests) > 0:
             passed = True
             backend = backends_passing_all_tests[0]
+            num_tests = backend_results[backend][0]
             sub_messages.append(
                 {
-                    "message": f"All {len(backend_results[backend])} tests for {backend} are passing",
+                    "message": f"All {num_tests} tests for {backend} are passing",
                     "passed": True,
                 }
             )
@@ -186,23 +194,27 @@ class ExpectationDiagnostics(SerializableDictDot):
     @staticmethod
     def _check_core_logic_for_all_applicable_execution_engines(
         test_results: List[ExpectationTestDiagnostics],
+        backend_results: Optional[Dict[str, List[int]]] = None,
     ) -> ExpectationDiagnosticCheckMessage:
         """Check whether core logic for this Expectation exists and passes tests on all applicable Execution Engines"""
 
         sub_messages = []
         backends_passing_all_tests = []
         backends_failing_any_tests = []
-        failing_names = []
-        backend_results = defaultdict(list)
+        failing_names = [
+            test_result.test_title
+            for test_result in test_results
+            if test_result.test_passed is False
+        ]
+        if backend_results is None:
+            backend_results = ExpectationDiagnostics._tally_test_results_by_backend(
+                test_results
+            )
         passed = False
         message = "Has core logic that passes tests for all applicable Execution Engines and SQL dialects"
-        for test_result in test_results:
-            backend_results[test_result.backend].append(test_result.test_passed)
-            if test_result.test_passed is False:
-                failing_names.append(test_result.test_title)
 
-        for backend in backend_results:
-            if all(backend_results[backend]):
+        for backend, (num_tests, num_passing) in backend_results.items():
+            if num_passing == num_tests:
                 backends_passing_all_tests.append(backend)
             else:
                 backends_failing_any_tests.append(backend)
@@ -211,16 +223,16 @@ class ExpectationDiagnostics(SerializableDictDot):
             passed = True
 
         for backend in backends_passing_all_tests:
+            num_tests = backend_results[backend][0]
             sub_messages.append(
                 {
-                    "message": f"All {len(backend_results[backend])} tests for {backend} are passing",
+                    "message": f"All {num_tests} tests for {backend} are passing",
                     "passed": True,
                 }
             )
 
         for backend in backends_failing_any_tests:
-            num_tests = len(backend_results[backend])
-            num_passing = backend_results[backend].count(True)
+            num_tests, num_passing = backend_results[backend]
             sub_messages.append(
                 {
                     "message": f"Only {num_passing} / {num_tests} tests for {backend} are passing",
@@ -250,6 +262,21 @@ class ExpectationDiagnostics(SerializableDictDot):
             sub_messages=sub_messages,
         )
 
+    @staticmethod
+    def _tally_test_results_by_backend(
+        test_results: List[ExpectationTestDiagnostics],
+    ) -> Dict[str, List[int]]:
+        """Scans test_results and returns a mapping of backend to a [num_tests, num_passing] pair"""
+
+        backend_results: Dict[str, List[int]] = {}
+        for test_result in test_results:
+            stats = backend_results.setdefault(test_result.backend, [0, 0])
+            stats[0] += 1
+            if test_result.test_passed:
+                stats[1] += 1
+
+        return backend_results
+
     @staticmethod
     def _count_positive_and_negative_example_cases(
         examples: List[ExpectationTestDataCases],
@@ -289,7 +316,7 @@ class ExpectationDiagnostics(SerializableDictDot):
     ) -> str:
         """Converts a list of checks into an output string (potentially nested), with ✔ to indicate checks that passed."""
 
-        output_message = f"Completeness checklist for {class_name}:"
+        output_lines: List[str] = [f"Completeness checklist for {class_name}:"]
 
         checks = (
             maturity_messages.experimental
@@ -299,19 +326,19 @@ class ExpectationDiagnostics(SerializableDictDot):
 
         for check in checks:
             if check["passed"]:
-                output_message += f"\n ✔ {check['message']}"
+                output_lines.append(f" ✔ {check['message']}")
             else:
-                output_message += f"\n   {check['message']}"
+                output_lines.append(f"   {check['message']}")
 
             if "sub_messages" in check:
                 for sub_message in check["sub_messages"]:
                     if sub_message["passed"]:
-                        output_message += f"\n    ✔ {sub_message['message']}"
+                        output_lines.append(f"    ✔ {sub_message['message']}")
                     else:
-                        output_message += f"\n      {sub_message['message']}"
-        output_message += "\n"
+                        output_lines.append(f"      {sub_message['message']}")
+        output_lines.append("")
 
-        return output_message
+        return "\n".join(output_lines)
 
     @staticmethod
     def _check_input_validation(
@@ -361,12 +388,12 @@ class ExpectationDiagnostics(SerializableDictDot):
         # sparsely implemented
         # all_renderer_types = {"diagnostic", "prescriptive", "question", "descriptive"}
         all_renderer_types = {"diagnostic", "prescriptive"}
-        renderer_names = [
-            name
-            for name in dir(expectation_instance)
-            if name.endswith("renderer") and name.startswith("_")
-        ]
-        renderer_types = {name.split("_")[1] for name in renderer_names}
+        renderer_types = set()
+        for klass in type(expectation_instance).__mro__:
+            for name in vars(klass):
+                match = _RENDERER_METHOD_NAME_REGEX.match(name)
+                if match:
+                    renderer_types.add(match.group(1))
         if renderer_types - {"question", "descriptive"} == all_renderer_types:
             passed = True
         return ExpectationDiagnosticCheckMessage(
@@ -29,9 +29,11 @@ logger = logging.getLogger(__name__)
 class Anonymizer:
     """Anonymize string names in an optionally-consistent way."""
 
+    __slots__ = ("_salt",)
+
     # Any class that starts with this __module__ is considered a "core" object
     CORE_GE_OBJECT_MODULE_PREFIX = "great_expectations"
-    CORE_GE_EXPECTATION_TYPES = aggregate_all_core_expectation_types()
+    CORE_GE_EXPECTATION_TYPES = frozenset(aggregate_all_core_expectation_types())
 
     def __init__(self, salt: Optional[str] = None) -> None:
         if salt is not None and not isinstance(salt, str):
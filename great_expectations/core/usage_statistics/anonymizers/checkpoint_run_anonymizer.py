@@ -28,8 +28,6 @@ class CheckpointRunAnonymizer(Anonymizer):
     def __init__(self, salt=None):
         super().__init__(salt=salt)
 
-        self._salt = salt
-
     # noinspection PyUnusedLocal
     def anonymize_checkpoint_run(self, *args, **kwargs) -> Dict[str, List[str]]:
         """
@@ -1,23 +1,46 @@
 import logging
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
 
 from great_expectations.core.usage_statistics.anonymizers.anonymizer import Anonymizer
-from great_expectations.core.usage_statistics.util import (
-    aggregate_all_core_expectation_types,
-)
 from great_expectations.rule_based_profiler.config.base import RuleBasedProfilerConfig
-from great_expectations.util import deep_filter_properties_iterable
 
 logger = logging.getLogger(__name__)
 
+# Shared across calls, as "_anonymize_object_info()" only reads the runtime environment.
+_DOMAIN_BUILDER_RUNTIME_ENVIRONMENT: dict = {
+    "module_name": "great_expectations.rule_based_profiler.domain_builder"
+}
+_PARAMETER_BUILDER_RUNTIME_ENVIRONMENT: dict = {
+    "module_name": "great_expectations.rule_based_profiler.parameter_builder"
+}
+_EXPECTATION_CONFIGURATION_BUILDER_RUNTIME_ENVIRONMENT: dict = {
+    "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder"
+}
+
 
 class ProfilerRunAnonymizer(Anonymizer):
+    """Anonymize RuleBasedProfiler configurations for usage statistics payloads.
+
+    Each builder payload is first seeded with its config-derived fields (names, batch
+    requests, conditions), and "_anonymize_object_info()" then adds class info in place.
+    """
+
+    __slots__ = ("_anonymize_cached",)
+
     def __init__(self, salt: Optional[str] = None) -> None:
         super().__init__(salt=salt)
 
-        self._ge_expectation_types = aggregate_all_core_expectation_types()
+        # Profiler configurations tend to repeat names, classes, and conditions across
+        # rules; hashes are memoized per instance since each instance has a fixed salt.
+        self._anonymize_cached = lru_cache(maxsize=4096)(super().anonymize)
+
+    def anonymize(self, string_: Optional[str]) -> Optional[str]:
+        if not isinstance(string_, str):
+            # None is returned untouched; invalid types raise within the parent method
+            return super().anonymize(string_)
 
-        self._salt = salt
+        return self._anonymize_cached(string_)
 
     def anonymize_profiler_run(self, profiler_config: RuleBasedProfilerConfig) -> dict:
         """
@@ -30,157 +53,125 @@ class ProfilerRunAnonymizer(Anonymizer):
         config_version: float = profiler_config.config_version
 
         rules: Dict[str, dict] = profiler_config.rules
-        anonymized_rules: List[dict] = self._anonymize_rules(rules=rules)
+        anonymized_rules: List[dict] = [
+            self._anonymize_rule(rule_name, rule) for rule_name, rule in rules.items()
+        ]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Anonymized rules %s", list(rules.keys()))
+
         rule_count: int = len(rules)
 
         variables: dict = profiler_config.variables or {}
         variable_count: int = len(variables)
 
-        anonymized_profiler_run_properties_dict: dict = {
-            "anonymized_name": anonymized_name,
-            "config_version": config_version,
-            "anonymized_rules": anonymized_rules,
-            "rule_count": rule_count,
-            "variable_count": variable_count,
-        }
-
-        deep_filter_properties_iterable(
-            properties=anonymized_profiler_run_properties_dict,
-            clean_falsy=True,
-            inplace=True,
-        )
+        # Falsy (non-numeric) values are omitted from the payload as they are emitted,
+        # rather than filtered out afterwards with a deep traversal of the result.
+        anonymized_profiler_run_properties_dict: dict = {}
+        if anonymized_name:
+            anonymized_profiler_run_properties_dict["anonymized_name"] = anonymized_name
+        if config_version is not None:
+            anonymized_profiler_run_properties_dict["config_version"] = config_version
+        if anonymized_rules:
+            anonymized_profiler_run_properties_dict[
+                "anonymized_rules"
+            ] = anonymized_rules
+        anonymized_profiler_run_properties_dict["rule_count"] = rule_count
+        anonymized_profiler_run_properties_dict["variable_count"] = variable_count
 
         return anonymized_profiler_run_properties_dict
 
-    def _anonymize_rules(self, rules: Dict[str, dict]) -> List[dict]:
-        anonymized_rules: List[dict] = []
-
-        for name, rule in rules.items():
-            anonymized_rule: dict = self._anonymize_rule(name, rule)
-            anonymized_rules.append(anonymized_rule)
-            logger.debug("Anonymized rule %s", name)
-
-        return anonymized_rules
-
     def _anonymize_rule(self, name: str, rule: dict) -> dict:
         anonymized_rule: dict = {}
-        anonymized_rule["anonymized_name"] = self.anonymize(name)
+
+        anonymized_name: Optional[str] = self.anonymize(name)
+        if anonymized_name:
+            anonymized_rule["anonymized_name"] = anonymized_name
 
         domain_builder: Optional[dict] = rule.get("domain_builder")
         if domain_builder is not None:
-            anonymized_rule[
-                "anonymized_domain_builder"
-            ] = self._anonymize_domain_builder(domain_builder)
-
-        parameter_builders: List[dict] = rule.get("parameter_builders", [])
-        anonymized_rule[
-            "anonymized_parameter_builders"
-        ] = self._anonymize_parameter_builders(parameter_builders)
-
-        expectation_configuration_builders: List[dict] = rule.get(
-            "expectation_configuration_builders", []
-        )
-        anonymized_rule[
-            "anonymized_expectation_configuration_builders"
-        ] = self._anonymize_expectation_configuration_builders(
-            expectation_configuration_builders
+            anonymized_domain_builder: dict = self._anonymize_domain_builder(
+                domain_builder
+            )
+            if anonymized_domain_builder:
+                anonymized_rule["anonymized_domain_builder"] = anonymized_domain_builder
+
+        # Missing builder lists fall back to a shared empty tuple (they are only read)
+        parameter_builders: Sequence[dict] = rule.get("parameter_builders") or ()
+        if parameter_builders:
+            anonymized_rule["anonymized_parameter_builders"] = [
+                self._anonymize_parameter_builder(parameter_builder)
+                for parameter_builder in parameter_builders
+            ]
+
+        expectation_configuration_builders: Sequence[dict] = (
+            rule.get("expectation_configuration_builders") or ()
         )
+        if expectation_configuration_builders:
+            anonymized_rule["anonymized_expectation_configuration_builders"] = [
+                self._anonymize_expectation_configuration_builder(
+                    expectation_configuration_builder
+                )
+                for expectation_configuration_builder in expectation_configuration_builders
+            ]
 
         return anonymized_rule
 
     def _anonymize_domain_builder(self, domain_builder: dict) -> dict:
-        anonymized_domain_builder: dict = self._anonymize_object_info(
-            object_config=domain_builder,
-            anonymized_info_dict={},
-            runtime_environment={
-                "module_name": "great_expectations.rule_based_profiler.domain_builder"
-            },
-        )
+        anonymized_domain_builder: dict = {}
 
         batch_request: Optional[dict] = domain_builder.get("batch_request")
         if batch_request:
             anonymized_batch_request: Optional[dict] = self.anonymize_batch_request(
                 **batch_request
             )
-            anonymized_domain_builder[
-                "anonymized_batch_request"
-            ] = anonymized_batch_request
+            if anonymized_batch_request:
+                anonymized_domain_builder[
+                    "anonymized_batch_request"
+                ] = anonymized_batch_request
             logger.debug("Anonymized batch request in DomainBuilder")
 
-        return anonymized_domain_builder
-
-    def _anonymize_parameter_builders(
-        self, parameter_builders: List[dict]
-    ) -> List[dict]:
-        anonymized_parameter_builders: List[dict] = []
-
-        for parameter_builder in parameter_builders:
-            anonymized_parameter_builder: dict = self._anonymize_parameter_builder(
-                parameter_builder
-            )
-            anonymized_parameter_builders.append(anonymized_parameter_builder)
-
-        return anonymized_parameter_builders
+        return self._anonymize_object_info(
+            object_config=domain_builder,
+            anonymized_info_dict=anonymized_domain_builder,
+            runtime_environment=_DOMAIN_BUILDER_RUNTIME_ENVIRONMENT,
+        )
 
     def _anonymize_parameter_builder(self, parameter_builder: dict) -> dict:
-        anonymized_parameter_builder: dict = self._anonymize_object_info(
-            object_config=parameter_builder,
-            anonymized_info_dict={},
-            runtime_environment={
-                "module_name": "great_expectations.rule_based_profiler.parameter_builder"
-            },
-        )
+        anonymized_parameter_builder: dict = {}
 
-        anonymized_parameter_builder["anonymized_name"] = self.anonymize(
-            parameter_builder.get("name")
-        )
+        anonymized_name: Optional[str] = self.anonymize(parameter_builder.get("name"))
+        if anonymized_name:
+            anonymized_parameter_builder["anonymized_name"] = anonymized_name
 
         batch_request: Optional[dict] = parameter_builder.get("batch_request")
         if batch_request:
             anonymized_batch_request: Optional[dict] = self.anonymize_batch_request(
                 **batch_request
             )
-            anonymized_parameter_builder[
-                "anonymized_batch_request"
-            ] = anonymized_batch_request
+            if anonymized_batch_request:
+                anonymized_parameter_builder[
+                    "anonymized_batch_request"
+                ] = anonymized_batch_request
             logger.debug("Anonymized batch request in ParameterBuilder")
 
-        return anonymized_parameter_builder
-
-    def _anonymize_expectation_configuration_builders(
-        self, expectation_configuration_builders: List[dict]
-    ) -> List[dict]:
-        anonymized_expectation_configuration_builders: List[dict] = []
-
-        for expectation_configuration_builder in expectation_configuration_builders:
-            anonymized_expectation_configuration_builder: dict = (
-                self._anonymize_expectation_configuration_builder(
-                    expectation_configuration_builder
-                )
-            )
-            anonymized_expectation_configuration_builders.append(
-                anonymized_expectation_configuration_builder
-            )
-
-        return anonymized_expectation_configuration_builders
+        return self._anonymize_object_info(
+            object_config=parameter_builder,
+            anonymized_info_dict=anonymized_parameter_builder,
+            runtime_environment=_PARAMETER_BUILDER_RUNTIME_ENVIRONMENT,
+        )
 
     def _anonymize_expectation_configuration_builder(
         self, expectation_configuration_builder: dict
     ) -> dict:
-        anonymized_expectation_configuration_builder: dict = self._anonymize_object_info(
-            object_config=expectation_configuration_builder,
-            anonymized_info_dict={},
-            runtime_environment={
-                "module_name": "great_expectations.rule_based_profiler.expectation_configuration_builder"
-            },
-        )
+        anonymized_expectation_configuration_builder: dict = {}
 
         expectation_type: Optional[str] = expectation_configuration_builder.get(
             "expectation_type"
         )
-        self.anonymize_expectation(
-            expectation_type, anonymized_expectation_configuration_builder
-        )
+        if expectation_type is not None:
+            self.anonymize_expectation(
+                expectation_type, anonymized_expectation_configuration_builder
+            )
 
         condition: Optional[str] = expectation_configuration_builder.get("condition")
         if condition:
@@ -189,4 +180,8 @@ class ProfilerRunAnonymizer(Anonymizer):
             ] = self.anonymize(condition)
             logger.debug("Anonymized condition in ExpectationConfigurationBuilder")
 
-        return anonymized_expectation_configuration_builder
+        return self._anonymize_object_info(
+            object_config=expectation_configuration_builder,
+            anonymized_info_dict=anonymized_expectation_configuration_builder,
+            runtime_environment=_EXPECTATION_CONFIGURATION_BUILDER_RUNTIME_ENVIRONMENT,
+        )
@@ -1534,6 +1534,9 @@ class Expectation(metaclass=MetaExpectation):
         beta_checks = []
         production_checks = []
 
+        # Both core logic checks aggregate test results per backend; tally them only once
+        backend_results = ExpectationDiagnostics._tally_test_results_by_backend(tests)
+
         experimental_checks.append(
             ExpectationDiagnostics._check_library_metadata(library_metadata)
         )
@@ -1543,7 +1546,7 @@ class Expectation(metaclass=MetaExpectation):
         )
         experimental_checks.append(
             ExpectationDiagnostics._check_core_logic_for_at_least_one_execution_engine(
-                tests
+                tests, backend_results
             )
         )
 
@@ -1553,7 +1556,7 @@ class Expectation(metaclass=MetaExpectation):
         beta_checks.append(ExpectationDiagnostics._check_renderer_methods(self))
         beta_checks.append(
             ExpectationDiagnostics._check_core_logic_for_all_applicable_execution_engines(
-                tests
+                tests, backend_results
             )
         )
 
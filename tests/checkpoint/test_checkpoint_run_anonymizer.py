@@ -4,6 +4,7 @@ import pytest
 from great_expectations import DataContext
 from great_expectations.checkpoint import Checkpoint
 from great_expectations.core.batch import RuntimeBatchRequest
+from great_expectations.core.usage_statistics.anonymizers.anonymizer import Anonymizer
 from great_expectations.core.usage_statistics.anonymizers.checkpoint_run_anonymizer import (
     CheckpointRunAnonymizer,
 )
@@ -115,3 +116,12 @@ def test_resolve_config_using_acceptable_arguments(checkpoint):
         resolved_runtime_kwargs["validations"][0]["expectation_suite_name"]
         == "test_suite"
     )
+
+
+def test_checkpoint_run_anonymizer_without_salt_uses_random_salt() -> None:
+    anonymizer: CheckpointRunAnonymizer = CheckpointRunAnonymizer()
+
+    assert isinstance(anonymizer.salt, str)
+    assert anonymizer.anonymize("my_checkpoint") == Anonymizer(
+        salt=anonymizer.salt
+    ).anonymize("my_checkpoint")
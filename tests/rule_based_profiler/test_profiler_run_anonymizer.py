@@ -2,6 +2,7 @@ from typing import Dict
 
 import pytest
 
+from great_expectations.core.usage_statistics.anonymizers.anonymizer import Anonymizer
 from great_expectations.core.usage_statistics.anonymizers.profiler_run_anonymizer import (
     ProfilerRunAnonymizer,
 )
@@ -293,3 +294,27 @@ def test_anonymize_profiler_run_with_condition_in_expectation_configuration_buil
         "rule_count": 1,
         "variable_count": 1,
     }
+
+
+def test_anonymize_is_memoized_and_consistent_with_base_anonymizer(
+    profiler_run_anonymizer: ProfilerRunAnonymizer,
+) -> None:
+    base_anonymizer: Anonymizer = Anonymizer(salt=profiler_run_anonymizer.salt)
+
+    first: str = profiler_run_anonymizer.anonymize("my_rule")
+    second: str = profiler_run_anonymizer.anonymize("my_rule")
+
+    assert first == second == base_anonymizer.anonymize("my_rule")
+    assert profiler_run_anonymizer._anonymize_cached.cache_info().hits == 1
+    assert profiler_run_anonymizer.anonymize(None) is None
+    with pytest.raises(TypeError):
+        profiler_run_anonymizer.anonymize(["not", "a", "string"])
+
+
+def test_profiler_run_anonymizer_without_salt_uses_random_salt() -> None:
+    anonymizer: ProfilerRunAnonymizer = ProfilerRunAnonymizer()
+
+    assert isinstance(anonymizer.salt, str)
+    assert anonymizer.anonymize("my_rule") == Anonymizer(
+        salt=anonymizer.salt
+    ).anonymize("my_rule")